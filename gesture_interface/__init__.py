@@ -1,3 +1,11 @@
 """Thesidia-HandControl-Alpha gesture interface package."""
 
-from .main import main  # re-export for convenience
+
+def __getattr__(name):
+    # Lazy re-export: the spawned dashboard process imports this package and
+    # must not pull in cv2/MediaPipe through .main
+    if name == "main":
+        from .main import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,459 @@
+"""Headless benchmarks for the gesture pipeline.
+
+Usage:
+  python -m gesture_interface.bench dashboard --clients 16 --duration 5
+  python -m gesture_interface.bench motion --frames 500
+  python -m gesture_interface.bench detector --video hand.mp4 --fps 30
+  python -m gesture_interface.bench pipeline --source video --path hand.mp4
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import threading
+import time
+import urllib.request
+from typing import Dict, List
+
+from .dashboard_server import run_server, start_server_process
+from .dashboard_state import DashboardState, SharedDashboardState
+from .gestures.symbolic_hooks import GestureClassifier
+from .motion import MotionGate
+from .sinks import DashboardSink, FrameResult
+
+
+def synthetic_hand(rng: random.Random, jitter: float = 0.01) -> list:
+    """A plausible open hand around the frame centre with small per-call jitter."""
+    landmarks = [(0.5, 0.8, 0.0)]
+    for finger in range(5):
+        angle = math.radians(-60 + finger * 30)
+        for joint in range(1, 5):
+            r = 0.08 * joint
+            landmarks.append(
+                (
+                    0.5 + r * math.sin(angle) + rng.uniform(-jitter, jitter),
+                    0.8 - r * math.cos(angle) + rng.uniform(-jitter, jitter),
+                    0.0,
+                )
+            )
+    return landmarks
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "frames": len(ordered),
+        "p50_ms": 1000.0 * ordered[len(ordered) // 2],
+        "p95_ms": 1000.0 * ordered[int(len(ordered) * 0.95)],
+        "mean_ms": 1000.0 * statistics.fmean(ordered),
+    }
+
+
+def _poll_state(url: str, stop, ready, poll_hz: float) -> None:
+    period = 1.0 / poll_hz if poll_hz > 0 else 0.0
+    ready.put(True)
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=1.0) as r:
+                r.read()
+        except OSError:
+            time.sleep(0.05)
+        if period:
+            time.sleep(max(0.0, period - (time.perf_counter() - t0)))
+
+
+def _wait_for_server(url: str, proc=None, timeout: float = 15.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc is not None and not proc.is_alive():
+            raise RuntimeError(
+                f"Dashboard process exited with code {proc.exitcode} "
+                f"before serving {url}"
+            )
+        try:
+            with urllib.request.urlopen(url, timeout=0.5) as r:
+                r.read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Dashboard did not come up at {url}")
+
+
+def _frame_loop(state, duration: float, work_iters: int) -> List[float]:
+    """Emulate the Python side of a frame: classify, some interpreter work, update."""
+    rng = random.Random(0)
+    classifier = GestureClassifier()
+    samples: List[float] = []
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        t0 = time.perf_counter()
+        lm = synthetic_hand(rng)
+        gesture, symbol = classifier.classify([(lm, "Right")])
+        acc = 0.0
+        for i in range(work_iters):
+            acc += (i * 0.5) % 7
+        state.update(gesture, symbol, 30.0, [(x, y) for (x, y, _z) in lm])
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def bench_dashboard(args) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    cpus = os.cpu_count() or 1
+    results: Dict[str, Dict[int, Dict[str, float]]] = {}
+    for offset, mode in enumerate(("thread", "process")):
+        port = args.port + offset
+        if mode == "process":
+            state = SharedDashboardState.create()
+            proc = start_server_process(args.host, port, state)
+        else:
+            state, proc = DashboardState(), None
+            threading.Thread(
+                target=run_server,
+                kwargs={"host": args.host, "port": port, "state": state},
+                daemon=True,
+            ).start()
+        url = f"http://{args.host}:{port}/state"
+        try:
+            _wait_for_server(url, proc)
+            for clients in (0, args.clients):
+                # Clients live in their own processes so they only load the server
+                stop, ready = ctx.Event(), ctx.Queue()
+                pollers = [
+                    ctx.Process(
+                        target=_poll_state,
+                        args=(url, stop, ready, args.poll_hz),
+                        daemon=True,
+                    )
+                    for _ in range(clients)
+                ]
+                for p in pollers:
+                    p.start()
+                # Spawned clients re-import the package; don't time their startup
+                for _ in pollers:
+                    ready.get(timeout=60.0)
+                time.sleep(0.5 if clients else 0.0)
+                stats = _percentiles(_frame_loop(state, args.duration, args.work))
+                stop.set()
+                for p in pollers:
+                    p.join(timeout=2.0)
+                results.setdefault(mode, {})[clients] = stats
+                print(
+                    f"mode={mode:<7} clients={clients:<3} frames={stats['frames']:<6} "
+                    f"p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms "
+                    f"mean={stats['mean_ms']:.2f}ms"
+                )
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.join(timeout=2.0)
+                state.close()
+
+    print(f"\nframe-time delta, {args.clients} clients vs 0 ({cpus} CPU(s)):")
+    deltas = {}
+    for mode, by_clients in results.items():
+        idle, loaded = by_clients[0], by_clients[args.clients]
+        deltas[mode] = loaded["p50_ms"] - idle["p50_ms"]
+        print(
+            f"  mode={mode:<7} p50 {deltas[mode]:+.2f}ms "
+            f"p95 {loaded['p95_ms'] - idle['p95_ms']:+.2f}ms"
+        )
+    if cpus < args.clients + 2:
+        # Clients, server and frame loop then share cores, so every mode slows
+        # down from plain CPU contention and the GIL effect cannot be isolated.
+        print(
+            f"  caveat: {cpus} CPU(s) for {args.clients} client processes + server + "
+            "frame loop; results mostly reflect CPU contention, not the GIL. "
+            "Run on a machine with more cores than clients + 2."
+        )
+    if args.max_delta_ms > 0:
+        if deltas["process"] > args.max_delta_ms:
+            raise SystemExit(
+                f"FAIL: process-mode p50 grew {deltas['process']:.2f}ms "
+                f"(limit {args.max_delta_ms:.2f}ms)"
+            )
+        print(f"  PASS: process-mode p50 delta within {args.max_delta_ms:.2f}ms")
+
+
+def bench_motion(args) -> None:
+    import numpy as np
+
+    from .renderer import OverlayRenderer
+
+    frame = np.zeros((args.height, args.width, 3), dtype=np.uint8)
+    for jitter, label in ((0.0005, "static"), (0.02, "moving")):
+        for gated in (False, True):
+            rng = random.Random(0)
+            gate = MotionGate(epsilon=args.epsilon, enabled=gated)
+            classifier = GestureClassifier()
+            renderer = OverlayRenderer()
+            sink = DashboardSink(DashboardState())
+            base = synthetic_hand(rng, jitter=0.0)
+            samples: List[float] = []
+            reevaluated = 0
+            for i in range(args.frames):
+                raw = [
+                    (
+                        [
+                            (x + rng.uniform(-jitter, jitter), y, z)
+                            for (x, y, z) in base
+                        ],
+                        "Right",
+                    )
+                ]
+                t0 = time.perf_counter()
+                hands, changed = gate.update(raw)
+                if changed:
+                    reevaluated += 1
+                    gesture, symbol = classifier.classify(hands)
+                renderer.render(frame, hands, gesture, symbol, 30.0, changed)
+                sink.handle(FrameResult(time.time(), i, hands, gesture, symbol, 30.0))
+                samples.append(time.perf_counter() - t0)
+            stats = _percentiles(samples)
+            print(
+                f"hand={label:<6} gate={'on' if gated else 'off':<3} "
+                f"reevaluated={reevaluated:<5} p50={stats['p50_ms']:.3f}ms "
+                f"mean={stats['mean_ms']:.3f}ms"
+            )
+
+
+def _load_frames(args) -> list:
+    """RGB frames from --video, or flat synthetic frames when no video is given."""
+    import cv2
+    import numpy as np
+
+    frames = []
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+        while len(frames) < args.frames:
+            ok, frame_bgr = cap.read()
+            if not ok:
+                break
+            frames.append(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB))
+        cap.release()
+        if not frames:
+            raise RuntimeError(f"No frames could be read from {args.video}")
+    else:
+        frames = [
+            np.full((args.height, args.width, 3), 40 + i % 8, dtype=np.uint8)
+            for i in range(min(args.frames, 8))
+        ]
+    return frames
+
+
+def bench_detector(args) -> None:
+    from .detector import DETECTOR_BACKENDS, create_detector
+
+    frames = _load_frames(args)
+    period = 1.0 / args.fps if args.fps > 0 else 0.0
+    for backend in args.backends or DETECTOR_BACKENDS:
+        config = {
+            "max_num_hands": args.max_num_hands,
+            "min_detection_confidence": 0.6,
+            "min_tracking_confidence": 0.6,
+            "detector": {"backend": backend, "model_path": args.model_path},
+        }
+        detector = create_detector(config)
+        call_times: List[float] = []
+        latencies: List[float] = []
+        completed = 0
+        start = time.perf_counter()
+        for i in range(args.frames):
+            t0 = time.perf_counter()
+            detector.process(frames[i % len(frames)])
+            dt = time.perf_counter() - t0
+            call_times.append(dt)
+            done = getattr(detector, "completed", None)
+            if done is None:  # blocking backend: one result per call
+                completed += 1
+                latencies.append(dt)
+            elif done != completed:
+                completed = done
+                latencies.append(detector.last_latency_ms / 1000.0)
+            if period:
+                time.sleep(max(0.0, period - (time.perf_counter() - t0)))
+        # Same window for every backend: results delivered while frames were fed
+        elapsed = time.perf_counter() - start
+        completed = getattr(detector, "completed", completed)
+        detector.close()
+        calls = _percentiles(call_times)
+        lat = _percentiles(latencies) if latencies else {"p50_ms": 0.0, "p95_ms": 0.0}
+        print(
+            f"backend={backend:<17} frames={args.frames:<5} "
+            f"results/s={completed / elapsed:6.1f} "
+            f"loop_block p50={calls['p50_ms']:.2f}ms p95={calls['p95_ms']:.2f}ms "
+            f"latency p50={lat['p50_ms']:.2f}ms p95={lat['p95_ms']:.2f}ms"
+        )
+
+
+def bench_pipeline(args) -> None:
+    """Source -> detector -> gate -> classify -> render -> sinks, with no window."""
+    import copy
+
+    import cv2
+
+    from .detector import create_detector
+    from .main import DEFAULT_CONFIG
+    from .renderer import OverlayRenderer
+    from .sinks import build_output_bus
+    from .sources import create_source
+
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update(width=args.width, height=args.height, capture_frames_on_change=False)
+    config["source"].update(
+        type=args.source,
+        path=args.path,
+        fps=args.fps,
+        num_frames=args.frames,
+        drop_stale=not args.keep_stale,
+    )
+    config["detector"].update(backend=args.backend, model_path=args.model_path)
+    config["motion_gate"]["enabled"] = not args.no_gate
+
+    source = create_source(config)
+    if not source.open():
+        raise RuntimeError(f"Could not open {args.source} source")
+    detector = create_detector(config) if args.backend != "none" else None
+    gate = MotionGate(
+        epsilon=float(config["motion_gate"]["epsilon"]),
+        enabled=bool(config["motion_gate"]["enabled"]),
+    )
+    classifier = GestureClassifier()
+    renderer = OverlayRenderer()
+    bus = build_output_bus(config, dashboard_state=DashboardState())
+
+    latencies: List[float] = []
+    gesture, symbol = None, None
+    start = time.time()
+    count = 0
+    try:
+        while count < args.frames:
+            frame = source.read()
+            if frame is None:
+                break
+            frame_rgb = cv2.cvtColor(frame.image, cv2.COLOR_BGR2RGB)
+            raw = detector.process(frame_rgb, frame.timestamp) if detector else []
+            hands, changed = gate.update(raw)
+            if changed:
+                gesture, symbol = classifier.classify(hands)
+            out = renderer.render(frame.image, hands, gesture, symbol, 0.0, changed)
+            bus.publish(
+                FrameResult(
+                    frame.timestamp, frame.index, hands, gesture, symbol, 0.0, frame=out
+                )
+            )
+            latencies.append(time.time() - frame.timestamp)
+            count += 1
+    finally:
+        elapsed = time.time() - start
+        source.release()
+        if detector:
+            detector.close()
+        sink_stats = bus.stats()
+        bus.close()
+    if not latencies:
+        raise RuntimeError("Source produced no frames")
+    lat = _percentiles(latencies)
+    print(
+        f"source={args.source} backend={args.backend} frames={count} "
+        f"fps={count / elapsed:.1f} capture->output p50={lat['p50_ms']:.2f}ms "
+        f"p95={lat['p95_ms']:.2f}ms"
+    )
+    if hasattr(source, "stale_dropped"):
+        print(f"stale camera frames dropped: {source.stale_dropped}")
+    for name, st in sink_stats.items():
+        print(
+            f"  sink={name:<10} processed={st['processed']:<6} "
+            f"dropped={st['dropped']:<6} avg={st['avg_ms']:.3f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m gesture_interface.bench")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    dash = sub.add_parser(
+        "dashboard", help="frame time vs. dashboard client load (thread vs process)"
+    )
+    dash.add_argument("--host", default="127.0.0.1")
+    dash.add_argument("--port", type=int, default=8865)
+    dash.add_argument("--clients", type=int, default=16)
+    dash.add_argument("--duration", type=float, default=5.0)
+    dash.add_argument(
+        "--poll-hz",
+        type=float,
+        default=10.0,
+        help="requests/s per client (the dashboard page polls at 10); 0 = flat out",
+    )
+    dash.add_argument(
+        "--max-delta-ms",
+        type=float,
+        default=0.0,
+        help="fail if process-mode p50 grows by more than this under load; 0 = report",
+    )
+    dash.add_argument(
+        "--work", type=int, default=20000, help="pure-Python iterations per frame"
+    )
+    dash.set_defaults(func=bench_dashboard)
+
+    motion = sub.add_parser(
+        "motion", help="per-frame cost of static vs moving hands, gate on/off"
+    )
+    motion.add_argument("--frames", type=int, default=500)
+    motion.add_argument("--epsilon", type=float, default=0.004)
+    motion.add_argument("--width", type=int, default=1280)
+    motion.add_argument("--height", type=int, default=720)
+    motion.set_defaults(func=bench_motion)
+
+    det = sub.add_parser(
+        "detector", help="throughput/latency of the detector backends"
+    )
+    det.add_argument("--video", help="video file to feed (default: synthetic frames)")
+    det.add_argument("--frames", type=int, default=300)
+    det.add_argument("--fps", type=float, default=30.0, help="submit rate; 0 = unpaced")
+    det.add_argument("--width", type=int, default=1280)
+    det.add_argument("--height", type=int, default=720)
+    det.add_argument("--max-num-hands", type=int, default=1)
+    det.add_argument("--model-path", default="models/hand_landmarker.task")
+    det.add_argument(
+        "--backends", nargs="*", help="subset of backends (default: all)"
+    )
+    det.set_defaults(func=bench_detector)
+
+    pipe = sub.add_parser(
+        "pipeline", help="end-to-end headless run from a frame source"
+    )
+    pipe.add_argument(
+        "--source",
+        default="synthetic",
+        choices=("camera", "video", "images", "synthetic"),
+    )
+    pipe.add_argument("--path", help="video file or image directory")
+    pipe.add_argument("--frames", type=int, default=300)
+    pipe.add_argument(
+        "--fps", type=float, default=0.0, help="source pacing; 0 = unpaced"
+    )
+    pipe.add_argument("--width", type=int, default=1280)
+    pipe.add_argument("--height", type=int, default=720)
+    pipe.add_argument(
+        "--backend",
+        default="solutions",
+        choices=("solutions", "tasks_live_stream", "none"),
+    )
+    pipe.add_argument("--model-path", default="models/hand_landmarker.task")
+    pipe.add_argument("--no-gate", action="store_true", help="disable the motion gate")
+    pipe.add_argument(
+        "--keep-stale", action="store_true", help="camera: disable stale-frame dropping"
+    )
+    pipe.set_defaults(func=bench_pipeline)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
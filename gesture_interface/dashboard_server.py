@@ -1,11 +1,12 @@
 import json
-import threading
+import multiprocessing
+import socket
 
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from .dashboard_state import GLOBAL_DASHBOARD_STATE
+from .dashboard_state import GLOBAL_DASHBOARD_STATE, SharedDashboardState
 
 HAND_CONNECTIONS = [
     (0, 1),
@@ -31,12 +32,13 @@ HAND_CONNECTIONS = [
 ]
 
 
-def create_app() -> FastAPI:
+def create_app(state=None) -> FastAPI:
     app = FastAPI()
+    state = state if state is not None else GLOBAL_DASHBOARD_STATE
 
     @app.get("/state")
     def get_state():
-        return JSONResponse(GLOBAL_DASHBOARD_STATE.get())
+        return JSONResponse(state.get())
 
     @app.get("/")
     def index():
@@ -140,7 +142,47 @@ def create_app() -> FastAPI:
     return app
 
 
-def run_server(host: str = "127.0.0.1", port: int = 8765):
+def run_server(host: str = "127.0.0.1", port: int = 8765, state=None):
     import uvicorn
 
-    uvicorn.run(create_app(), host=host, port=port, log_level="info")
+    uvicorn.run(create_app(state), host=host, port=port, log_level="info")
+
+
+def _serve_shared(host: str, port: int, shm_name: str) -> None:
+    state = SharedDashboardState.attach(shm_name)
+    try:
+        run_server(host=host, port=port, state=state)
+    finally:
+        state.close()
+
+
+def check_port_available(host: str, port: int) -> None:
+    """Raise OSError if host:port cannot be bound, e.g. because it is in use."""
+    family, kind, proto, _name, addr = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )[0]
+    with socket.socket(family, kind, proto) as s:
+        # Same option uvicorn sets, so TIME_WAIT sockets don't count as in use
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(addr)
+
+
+def start_server_process(
+    host: str, port: int, state: SharedDashboardState
+) -> multiprocessing.Process:
+    """Serve the dashboard from a separate process reading `state` via shared memory.
+
+    Raises OSError up front if the port cannot be bound; the child would
+    otherwise exit on its own where the caller never sees it.
+    """
+    check_port_available(host, port)
+    # spawn avoids forking a process that already holds camera/MediaPipe threads
+    ctx = multiprocessing.get_context("spawn")
+    proc = ctx.Process(
+        target=_serve_shared,
+        args=(host, port, state.name),
+        name="thesidia-dashboard",
+        daemon=True,
+    )
+    proc.start()
+    return proc
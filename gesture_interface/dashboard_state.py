@@ -1,6 +1,15 @@
+import json
+import logging
+import struct
 import threading
+import time
+from multiprocessing import shared_memory
 from typing import Any, Dict, List, Optional, Tuple
 
+# Shared-memory layout: [seq: uint64][length: uint32][payload: utf-8 JSON]
+_HEADER = struct.Struct("<QI")
+DEFAULT_SHM_SIZE = 64 * 1024
+
 
 class DashboardState:
     def __init__(self) -> None:
@@ -10,6 +19,7 @@ class DashboardState:
             "symbol": None,
             "fps": 0.0,
             "landmarks": [],  # [[x,y], ...] normalized 0..1
+            "sinks": {},  # per-sink queue/drop/timing stats
         }
 
     def update(
@@ -28,9 +38,127 @@ class DashboardState:
                     [float(x), float(y)] for (x, y) in landmarks
                 ]
 
+    def update_sinks(self, stats: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._state["sinks"] = stats
+
     def get(self) -> Dict[str, Any]:
         with self._lock:
             return dict(self._state)
 
 
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class SharedDashboardState:
+    """Dashboard state published through shared memory for a separate server process.
+
+    The inference process is the only writer and never blocks: each update is
+    written under a sequence counter (odd while writing, even when stable).
+    Readers retry when the counter changes underneath them and cache the last
+    decoded snapshot, so any number of dashboard clients costs the writer nothing.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._state: Dict[str, Any] = {
+            "gesture": None,
+            "symbol": None,
+            "fps": 0.0,
+            "landmarks": [],
+            "sinks": {},
+        }
+        # Landmarks/sinks change far less often than fps; keep them pre-encoded
+        self._encoded = {"landmarks": "[]", "sinks": "{}"}
+        self._seq = 0
+        self._read_seq = -1
+        self._read_lock = threading.Lock()
+
+    @classmethod
+    def create(cls, size: int = DEFAULT_SHM_SIZE) -> "SharedDashboardState":
+        shm = shared_memory.SharedMemory(create=True, size=int(size))
+        _HEADER.pack_into(shm.buf, 0, 0, 0)
+        state = cls(shm, owner=True)
+        state._publish()
+        return state
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedDashboardState":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def update(
+        self,
+        gesture: Optional[str],
+        symbol: Optional[str],
+        fps: float,
+        landmarks: Optional[List[Tuple[float, float]]] = None,
+    ) -> None:
+        self._state["gesture"] = gesture
+        self._state["symbol"] = symbol
+        self._state["fps"] = float(fps)
+        if landmarks is not None:
+            self._state["landmarks"] = [[float(x), float(y)] for (x, y) in landmarks]
+            self._encoded["landmarks"] = _dumps(self._state["landmarks"])
+        self._publish()
+
+    def update_sinks(self, stats: Dict[str, Dict[str, Any]]) -> None:
+        self._state["sinks"] = stats
+        self._encoded["sinks"] = _dumps(stats)
+        self._publish()
+
+    def _publish(self) -> None:
+        st = self._state
+        payload = (
+            f'{{"gesture":{_dumps(st["gesture"])},"symbol":{_dumps(st["symbol"])},'
+            f'"fps":{_dumps(st["fps"])},"landmarks":{self._encoded["landmarks"]},'
+            f'"sinks":{self._encoded["sinks"]}}}'
+        ).encode("utf-8")
+        buf = self._shm.buf
+        if _HEADER.size + len(payload) > len(buf):
+            logging.warning(
+                "Dashboard state (%d bytes) exceeds shared memory size", len(payload)
+            )
+            return
+        self._seq += 1  # odd: write in progress
+        _HEADER.pack_into(buf, 0, self._seq, 0)
+        buf[_HEADER.size : _HEADER.size + len(payload)] = payload
+        self._seq += 1  # even: stable
+        _HEADER.pack_into(buf, 0, self._seq, len(payload))
+
+    def get(self) -> Dict[str, Any]:
+        with self._read_lock:
+            buf = self._shm.buf
+            for _ in range(100):
+                seq, length = _HEADER.unpack_from(buf, 0)
+                if seq == self._read_seq:
+                    break
+                if seq % 2:
+                    time.sleep(0)
+                    continue
+                payload = bytes(buf[_HEADER.size : _HEADER.size + length])
+                if _HEADER.unpack_from(buf, 0)[0] != seq:
+                    continue
+                try:
+                    self._state = json.loads(payload)
+                except ValueError:
+                    continue
+                self._read_seq = seq
+                break
+            return dict(self._state)
+
+    def close(self) -> None:
+        try:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        except (BufferError, FileNotFoundError):
+            pass
+
+
 GLOBAL_DASHBOARD_STATE = DashboardState()
@@ -1,7 +1,17 @@
+import collections
+import logging
+import os
+import threading
+import time
 from typing import List, Optional, Tuple
 
 import mediapipe as mp
 
+MODEL_URL = (
+    "https://storage.googleapis.com/mediapipe-models/hand_landmarker/"
+    "hand_landmarker/float16/latest/hand_landmarker.task"
+)
+
 
 class HandLandmarkDetector:
     """Thin wrapper around MediaPipe Hands."""
@@ -21,7 +31,9 @@ class HandLandmarkDetector:
             model_complexity=1,
         )
 
-    def process(self, frame_rgb) -> List[Tuple[list, str]]:
+    def process(
+        self, frame_rgb, timestamp: Optional[float] = None
+    ) -> List[Tuple[list, str]]:
         """
         Returns a list of (landmarks, handedness) pairs for each detected hand.
         - landmarks: list of 21 (x, y, z) normalized coords
@@ -38,8 +50,124 @@ class HandLandmarkDetector:
                 output.append((lm, label))
         return output
 
+    def close(self) -> None:
+        self._hands.close()
+
     def __del__(self):
         try:
-            self._hands.close()
+            self.close()
         except Exception:
             pass
+
+
+class LiveStreamHandLandmarkDetector:
+    """MediaPipe Tasks HandLandmarker in LIVE_STREAM mode.
+
+    `process()` submits the frame and returns immediately with the most recent
+    result delivered by the callback, so capture and rendering never wait on
+    inference. Results therefore lag the submitted frame by the inference
+    latency; MediaPipe drops frames submitted while it is still busy.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        max_num_hands: int = 1,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+    ) -> None:
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"Hand landmarker model not found at {model_path!r}. "
+                f"Download it from {MODEL_URL}"
+            )
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result,
+        )
+        self._lock = threading.Lock()
+        self._latest: List[Tuple[list, str]] = []
+        self._pending: "collections.deque[Tuple[int, float]]" = collections.deque()
+        self._last_ts_ms = -1
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.last_latency_ms = 0.0
+        self._landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def process(
+        self, frame_rgb, timestamp: Optional[float] = None
+    ) -> List[Tuple[list, str]]:
+        """Submit `frame_rgb`; return the latest (landmarks, handedness) results.
+
+        `timestamp` is the frame's capture time (time.time()); defaults to now.
+        """
+        captured = time.time() if timestamp is None else float(timestamp)
+        # Timestamps must be strictly increasing
+        ts_ms = max(int(captured * 1000), self._last_ts_ms + 1)
+        self._last_ts_ms = ts_ms
+        with self._lock:
+            self._pending.append((ts_ms, captured))
+            self.submitted += 1
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+        self._landmarker.detect_async(image, ts_ms)
+        with self._lock:
+            return self._latest
+
+    def _on_result(self, result, _output_image, timestamp_ms: int) -> None:
+        output: List[Tuple[list, str]] = []
+        for hand_landmarks, handedness in zip(result.hand_landmarks, result.handedness):
+            lm = [(p.x, p.y, p.z) for p in hand_landmarks]
+            output.append((lm, handedness[0].category_name))
+        done = time.time()
+        with self._lock:
+            # Anything submitted before this timestamp was skipped by MediaPipe
+            while self._pending and self._pending[0][0] < timestamp_ms:
+                self._pending.popleft()
+                self.dropped += 1
+            if self._pending and self._pending[0][0] == timestamp_ms:
+                _ts, captured = self._pending.popleft()
+                self.last_latency_ms = 1000.0 * (done - captured)
+            self.completed += 1
+            self._latest = output
+
+    def close(self) -> None:
+        self._landmarker.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+DETECTOR_BACKENDS = ("solutions", "tasks_live_stream")
+
+
+def create_detector(config: dict):
+    """Build the hand detector selected by `detector.backend` in the config."""
+    det_cfg = config.get("detector", {})
+    backend = str(det_cfg.get("backend", "solutions"))
+    common = dict(
+        max_num_hands=int(config["max_num_hands"]),
+        min_detection_confidence=float(config["min_detection_confidence"]),
+        min_tracking_confidence=float(config["min_tracking_confidence"]),
+    )
+    if backend == "tasks_live_stream":
+        return LiveStreamHandLandmarkDetector(
+            model_path=str(det_cfg.get("model_path", "models/hand_landmarker.task")),
+            **common,
+        )
+    if backend != "solutions":
+        logging.warning(
+            "Unknown detector backend %r (expected one of %s); using solutions",
+            backend,
+            DETECTOR_BACKENDS,
+        )
+    return HandLandmarkDetector(**common)
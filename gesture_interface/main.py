@@ -2,17 +2,19 @@ import logging
 import os
 import threading
 import time
-from datetime import datetime
 
 import cv2
 import yaml
 
-from .dashboard_server import run_server
-from .dashboard_state import GLOBAL_DASHBOARD_STATE
-from .detector import HandLandmarkDetector
+from .dashboard_server import run_server, start_server_process
+from .dashboard_state import GLOBAL_DASHBOARD_STATE, SharedDashboardState
+from .detector import create_detector
 from .gestures.symbolic_hooks import GestureClassifier
+from .motion import MotionGate
 from .osc_output import OSCEmitter
 from .renderer import OverlayRenderer
+from .sinks import FrameResult, build_output_bus
+from .sources import create_source
 
 DEFAULT_CONFIG = {
     "camera_index": 0,
@@ -29,10 +31,28 @@ DEFAULT_CONFIG = {
     "window_title": "Thesidia-HandControl-Alpha",
     "black_background": True,
     "draw_fps": True,
+    "display": True,  # False for headless runs (no OpenCV window)
+    "source": {
+        "type": "camera",  # camera | video | images | synthetic
+        "path": None,  # video file or image directory
+        "loop": False,
+        "fps": 0.0,  # camera: requested rate; files/synthetic: pacing, 0 = unpaced
+        "buffer_size": 1,
+        "fourcc": None,  # e.g. MJPG
+        "drop_stale": True,
+        "read_timeout_sec": 2.0,  # camera: warn after this long without a frame
+        "pattern": "moving_box",
+        "num_frames": 0,
+    },
+    "detector": {
+        "backend": "solutions",  # "solutions" (blocking) or "tasks_live_stream"
+        "model_path": "models/hand_landmarker.task",
+    },
     "dashboard": {
         "enabled": True,
         "host": "127.0.0.1",
         "port": 8765,
+        "mode": "thread",  # "thread" (in-process) or "process" (shared memory)
     },
     "constellation": {
         "enabled": True,
@@ -46,9 +66,33 @@ DEFAULT_CONFIG = {
         "port": 9000,
         "send_landmarks": False,
         "fps_interval_sec": 0.5,
+        "landmarks_keepalive_sec": 1.0,
+    },
+    "motion_gate": {
+        "enabled": True,
+        "epsilon": 0.004,  # max per-landmark move (normalized) treated as still
+    },
+    "sinks": {
+        "stats_interval_sec": 1.0,
+        "dashboard": {"queue_size": 1, "drop_policy": "drop_oldest"},
+        "osc": {"queue_size": 8, "drop_policy": "drop_oldest"},
+        "log": {"queue_size": 64, "drop_policy": "drop_newest"},
+        "frames": {"queue_size": 4, "drop_policy": "drop_newest"},
+        "stats": {"enabled": True, "log_interval_sec": 10.0},
+        "custom": [],
     },
 }
 
+NESTED_CONFIG_KEYS = (
+    "source",
+    "osc",
+    "constellation",
+    "detector",
+    "dashboard",
+    "motion_gate",
+    "sinks",
+)
+
 
 def ensure_directories(paths):
     for path in paths:
@@ -75,37 +119,41 @@ def load_config() -> dict:
         with open(config_path, "r", encoding="utf-8") as f:
             user_cfg = yaml.safe_load(f) or {}
             # Deep-merge for nested dicts
-            base_osc = config["osc"].copy()
-            base_osc.update((user_cfg or {}).get("osc", {}))
-            base_const = config["constellation"].copy()
-            base_const.update((user_cfg or {}).get("constellation", {}))
-            base_dash = config["dashboard"].copy()
-            base_dash.update((user_cfg or {}).get("dashboard", {}))
+            merged = {}
+            for key in NESTED_CONFIG_KEYS:
+                merged[key] = config[key].copy()
+                merged[key].update(user_cfg.get(key) or {})
             config.update(
-                {
-                    k: v
-                    for k, v in user_cfg.items()
-                    if k not in ("osc", "constellation", "dashboard")
-                }
+                {k: v for k, v in user_cfg.items() if k not in NESTED_CONFIG_KEYS}
             )
-            config["osc"] = base_osc
-            config["constellation"] = base_const
-            config["dashboard"] = base_dash
+            config.update(merged)
     return config
 
 
-def save_frame(frame, frames_dir: str, gesture_name: str) -> None:
-    ensure_directories([frames_dir])
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    filename = f"{gesture_name}_{timestamp}.jpg"
-    cv2.imwrite(os.path.join(frames_dir, filename), frame)
-
-
-def start_dashboard_server(host: str, port: int) -> None:
+def start_dashboard_server(host: str, port: int, mode: str = "thread"):
+    """Start the dashboard and return (state to update, server process or None)."""
+    if mode == "process":
+        state = SharedDashboardState.create()
+        try:
+            return state, start_server_process(host, port, state)
+        except OSError:
+            state.close()
+            raise
+    if mode != "thread":
+        logging.warning("Unknown dashboard mode %r; using thread", mode)
     t = threading.Thread(
         target=run_server, kwargs={"host": host, "port": port}, daemon=True
     )
     t.start()
+    return GLOBAL_DASHBOARD_STATE, None
+
+
+def stop_dashboard_server(state, proc) -> None:
+    if proc is not None:
+        proc.terminate()
+        proc.join(timeout=2.0)
+    if isinstance(state, SharedDashboardState):
+        state.close()
 
 
 def main() -> None:
@@ -113,33 +161,38 @@ def main() -> None:
     configure_logging(config["logs_dir"])  # logs to file and console
 
     dash_cfg = config.get("dashboard", {})
-    if dash_cfg.get("enabled", True):
-        start_dashboard_server(
-            str(dash_cfg.get("host", "127.0.0.1")), int(dash_cfg.get("port", 8765))
-        )
+    dashboard_state, dashboard_proc = GLOBAL_DASHBOARD_STATE, None
+    dashboard_enabled = bool(dash_cfg.get("enabled", True))
+    if dashboard_enabled:
+        host = str(dash_cfg.get("host", "127.0.0.1"))
+        port = int(dash_cfg.get("port", 8765))
+        try:
+            dashboard_state, dashboard_proc = start_dashboard_server(
+                host, port, str(dash_cfg.get("mode", "thread"))
+            )
+        except OSError as e:
+            logging.error(
+                "Dashboard disabled: cannot serve on %s:%s (%s)", host, port, e
+            )
+            dashboard_enabled = False
 
-    camera_index = int(config["camera_index"])  # webcam index
-    # Prefer AVFoundation on macOS; fallback to default if needed
-    backend = cv2.CAP_AVFOUNDATION if hasattr(cv2, "CAP_AVFOUNDATION") else 0
-    cap = cv2.VideoCapture(camera_index, backend)
-    if not cap.isOpened():
-        cap = cv2.VideoCapture(camera_index)
-    if not cap.isOpened():
-        logging.error(
-            "Could not open webcam at index %s. On macOS, grant Camera access to Terminal/Python in System Settings > Privacy & Security > Camera.",
-            camera_index,
-        )
+    try:
+        source = create_source(config)
+    except ValueError as e:
+        logging.error("%s", e)
+        stop_dashboard_server(dashboard_state, dashboard_proc)
+        return
+    if not source.open():
+        stop_dashboard_server(dashboard_state, dashboard_proc)
         return
 
-    # Set resolution
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, config["width"])
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config["height"])
-
-    detector = HandLandmarkDetector(
-        max_num_hands=int(config["max_num_hands"]),
-        min_detection_confidence=float(config["min_detection_confidence"]),
-        min_tracking_confidence=float(config["min_tracking_confidence"]),
-    )
+    try:
+        detector = create_detector(config)
+    except FileNotFoundError as e:
+        logging.error("%s", e)
+        source.release()
+        stop_dashboard_server(dashboard_state, dashboard_proc)
+        return
 
     const_cfg = config.get("constellation", {})
     renderer = OverlayRenderer(
@@ -156,10 +209,15 @@ def main() -> None:
 
     classifier = GestureClassifier()
 
+    gate_cfg = config.get("motion_gate", {})
+    motion_gate = MotionGate(
+        epsilon=float(gate_cfg.get("epsilon", 0.004)),
+        enabled=bool(gate_cfg.get("enabled", True)),
+    )
+
     osc_cfg = config.get("osc", {})
     osc_enabled = bool(osc_cfg.get("enabled", False))
     osc = None
-    last_osc_fps_time = 0.0
     if osc_enabled:
         osc = OSCEmitter(
             host=str(osc_cfg.get("host", "127.0.0.1")),
@@ -167,67 +225,88 @@ def main() -> None:
             send_landmarks=bool(osc_cfg.get("send_landmarks", False)),
         )
 
+    # Dashboard, OSC, logging and frame capture run on their own sink workers
+    try:
+        bus = build_output_bus(
+            config,
+            dashboard_state=dashboard_state if dashboard_enabled else None,
+            osc=osc,
+        )
+    except Exception as e:  # bad drop_policy, custom factory import/call errors
+        logging.error("Could not set up output sinks: %s", e)
+        source.release()
+        detector.close()
+        stop_dashboard_server(dashboard_state, dashboard_proc)
+        return
+
+    display = bool(config.get("display", True))
     last_gesture = None
+    gesture_name, symbol = None, None
     last_time = time.time()
 
     try:
         while True:
-            ok, frame_bgr = cap.read()
-            if not ok:
-                logging.warning("Frame grab failed")
+            frame = source.read()
+            if frame is None:
+                logging.warning("Frame source ended or frame grab failed")
                 break
+            frame_bgr = frame.image
+
+            if dashboard_proc is not None and not dashboard_proc.is_alive():
+                logging.error(
+                    "Dashboard process exited with code %s", dashboard_proc.exitcode
+                )
+                dashboard_proc = None
 
             if config["mirror"]:
                 frame_bgr = cv2.flip(frame_bgr, 1)
 
             frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
 
-            hands = detector.process(frame_rgb)
-            gesture_name, symbol = classifier.classify(hands)
+            # Static holds reuse the previous hands object, classification and overlay
+            hands, hands_changed = motion_gate.update(
+                detector.process(frame_rgb, frame.timestamp)
+            )
+            if hands_changed:
+                gesture_name, symbol = classifier.classify(hands)
 
             now = time.time()
             fps = 1.0 / max(now - last_time, 1e-6)
             last_time = now
 
-            # Prepare normalized landmarks for dashboard (first hand only), preserve last when none
-            dash_landmarks = None
-            if hands:
-                lm, _handed = hands[0]
-                dash_landmarks = [(x, y) for (x, y, _z) in lm]
-
-            # Update dashboard state
-            GLOBAL_DASHBOARD_STATE.update(gesture_name, symbol, fps, dash_landmarks)
-
-            if osc_enabled and osc:
-                # Send FPS at a throttled interval
-                if now - last_osc_fps_time >= float(
-                    osc_cfg.get("fps_interval_sec", 0.5)
-                ):
-                    osc.send_fps(fps)
-                    last_osc_fps_time = now
-                # Optionally send landmarks each frame
-                if bool(osc_cfg.get("send_landmarks", False)):
-                    osc.send_landmarks(hands)
-
-            output_frame = renderer.render(frame_bgr, hands, gesture_name, symbol, fps)
-
-            # Log and save frame on gesture change
-            if gesture_name != last_gesture:
-                if gesture_name is not None:
-                    logging.info("GESTURE: %s | SYMBOL: %s", gesture_name, symbol)
-                    if osc_enabled and osc:
-                        osc.send_gesture(gesture_name, symbol)
-                    if config["capture_frames_on_change"]:
-                        save_frame(output_frame, config["frames_dir"], gesture_name)
-                last_gesture = gesture_name
-
-            cv2.imshow(renderer.window_title, output_frame)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord("q"):
-                break
+            output_frame = renderer.render(
+                frame_bgr, hands, gesture_name, symbol, fps, hands_changed
+            )
+
+            bus.publish(
+                FrameResult(
+                    timestamp=frame.timestamp,  # capture time
+                    frame_index=frame.index,
+                    hands=hands,
+                    gesture_name=gesture_name,
+                    symbol=symbol,
+                    fps=fps,
+                    gesture_changed=gesture_name != last_gesture,
+                    frame=output_frame,
+                )
+            )
+            last_gesture = gesture_name
+
+            # Display stays inline: HighGUI must run on the main thread
+            if display:
+                cv2.imshow(renderer.window_title, output_frame)
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord("q"):
+                    break
+    except KeyboardInterrupt:
+        pass
     finally:
-        cap.release()
-        cv2.destroyAllWindows()
+        source.release()
+        if display:
+            cv2.destroyAllWindows()
+        detector.close()
+        bus.close()
+        stop_dashboard_server(dashboard_state, dashboard_proc)
 
 
 if __name__ == "__main__":
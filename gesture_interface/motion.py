@@ -0,0 +1,39 @@
+from typing import List, Tuple
+
+
+class MotionGate:
+    """Cheap per-frame check of whether the hands moved enough to re-evaluate.
+
+    Landmarks are compared against the last frame that was accepted as changed
+    (not the previous frame), so slow drift still trips the gate eventually.
+    While the gate is closed, the accepted hands are returned unchanged so every
+    downstream cache refers to the same input.
+    """
+
+    def __init__(self, epsilon: float = 0.004, enabled: bool = True) -> None:
+        self.epsilon = float(epsilon)
+        self.enabled = enabled
+        self._hands: List[Tuple[list, str]] = []
+        self._primed = False
+
+    def update(
+        self, hands: List[Tuple[list, str]]
+    ) -> Tuple[List[Tuple[list, str]], bool]:
+        """Returns (hands to use this frame, whether they changed meaningfully)."""
+        if not self.enabled or not self._primed or self._moved(hands):
+            self._hands = hands
+            self._primed = True
+            return hands, True
+        return self._hands, False
+
+    def _moved(self, hands: List[Tuple[list, str]]) -> bool:
+        if len(hands) != len(self._hands):
+            return True
+        eps = self.epsilon
+        for (lm, handed), (prev_lm, prev_handed) in zip(hands, self._hands):
+            if handed != prev_handed or len(lm) != len(prev_lm):
+                return True
+            for (x, y, _z), (px, py, _pz) in zip(lm, prev_lm):
+                if abs(x - px) > eps or abs(y - py) > eps:
+                    return True
+        return False
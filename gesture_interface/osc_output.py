@@ -8,7 +8,7 @@ class OSCEmitter:
         self, host: str = "127.0.0.1", port: int = 9000, send_landmarks: bool = False
     ) -> None:
         self.client = SimpleUDPClient(host, int(port))
-        self.send_landmarks = bool(send_landmarks)
+        self.landmarks_enabled = bool(send_landmarks)
 
     def send_gesture(self, gesture_name: Optional[str], symbol: Optional[str]) -> None:
         name = gesture_name or "NONE"
@@ -19,7 +19,7 @@ class OSCEmitter:
         self.client.send_message("/thesidia/fps", float(fps))
 
     def send_landmarks(self, hands: List[Tuple[list, str]]) -> None:
-        if not self.send_landmarks:
+        if not self.landmarks_enabled:
             return
         # Send first hand only to keep bandwidth minimal
         if not hands:
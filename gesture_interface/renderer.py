@@ -49,6 +49,7 @@ class OverlayRenderer:
         self.constellation_neighbors = max(1, int(constellation_neighbors))
         self.constellation_point_radius = int(constellation_point_radius)
         self.constellation_line_thickness = int(constellation_line_thickness)
+        self._hand_layer: Optional[np.ndarray] = None
 
     def render(
         self,
@@ -57,19 +58,24 @@ class OverlayRenderer:
         gesture_name: Optional[str],
         symbol: Optional[str],
         fps: float,
+        hands_changed: bool = True,
     ) -> np.ndarray:
-        h, w = frame_bgr.shape[:2]
+        """Pass hands_changed=False to reuse the cached skeleton/constellation layer."""
+        layer = self._hand_layer
+        if hands_changed or layer is None or layer.shape != frame_bgr.shape:
+            # Draw each hand landmarks and skeleton in white on a black layer
+            layer = np.zeros_like(frame_bgr)
+            for landmarks, handedness in hands:
+                self._draw_hand(layer, landmarks, color=(255, 255, 255), thickness=2)
+                if self.constellation_enabled:
+                    self._draw_constellation(layer, landmarks, (255, 255, 255))
+            self._hand_layer = layer
 
         if self.show_camera_background and not self.black_background:
-            canvas = frame_bgr.copy()
+            # White overlay on black composites over the camera with a max
+            canvas = cv2.max(frame_bgr, layer)
         else:
-            canvas = np.zeros_like(frame_bgr)
-
-        # Draw each hand landmarks and skeleton in white
-        for landmarks, handedness in hands:
-            self._draw_hand(canvas, landmarks, color=(255, 255, 255), thickness=2)
-            if self.constellation_enabled:
-                self._draw_constellation(canvas, landmarks, (255, 255, 255))
+            canvas = layer.copy()
 
         # Title and labels in white
         y = 30
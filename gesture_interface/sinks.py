@@ -0,0 +1,453 @@
+import importlib
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+_STOP = object()
+
+
+class FrameResult:
+    """Everything the loop produced for one frame, fanned out to sinks."""
+
+    __slots__ = (
+        "timestamp",
+        "frame_index",
+        "hands",
+        "gesture_name",
+        "symbol",
+        "fps",
+        "gesture_changed",
+        "frame",
+    )
+
+    def __init__(
+        self,
+        timestamp: float,
+        frame_index: int,
+        hands: List[Tuple[list, str]],
+        gesture_name: Optional[str],
+        symbol: Optional[str],
+        fps: float,
+        gesture_changed: bool = False,
+        frame=None,
+    ) -> None:
+        self.timestamp = timestamp
+        self.frame_index = frame_index
+        self.hands = hands
+        self.gesture_name = gesture_name
+        self.symbol = symbol
+        self.fps = fps
+        self.gesture_changed = gesture_changed
+        self.frame = frame  # rendered BGR output
+
+
+class Sink:
+    """Base class for outputs. `handle` runs on the sink's own worker thread."""
+
+    name = "sink"
+
+    def handle(self, result: FrameResult) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SinkWorker:
+    """Bounded queue + worker thread for one sink, with drop policy and rate limit."""
+
+    def __init__(
+        self,
+        sink: Sink,
+        name: str,
+        queue_size: int = 4,
+        drop_policy: str = "drop_oldest",
+        max_rate_hz: float = 0.0,
+    ) -> None:
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Unknown drop_policy {drop_policy!r} for sink {name!r}; "
+                f"expected one of {DROP_POLICIES}"
+            )
+        self.sink = sink
+        self.name = name
+        self.drop_policy = drop_policy
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._lock = threading.Lock()
+        self._last_accept = 0.0
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._rate_limited = 0
+        self._errors = 0
+        self._busy_total = 0.0
+        self._busy_max = 0.0
+        self._thread = threading.Thread(
+            target=self._run, name=f"sink-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, result: FrameResult) -> None:
+        now = time.perf_counter()
+        # Gesture changes are never rate limited; they drive logging/capture/OSC
+        if (
+            self.min_interval
+            and not result.gesture_changed
+            and now - self._last_accept < self.min_interval
+        ):
+            self._rate_limited += 1
+            return
+        self._last_accept = now
+        self._submitted += 1
+        if self.drop_policy == "block":
+            self._queue.put(result)
+            return
+        try:
+            self._queue.put_nowait(result)
+            return
+        except queue.Full:
+            pass
+        # Gesture changes are never dropped: evict an ordinary result instead,
+        # or wait for the worker if the queue holds nothing but changes.
+        if result.gesture_changed or self.drop_policy == "drop_oldest":
+            if self._evict_oldest_droppable():
+                with self._lock:
+                    self._dropped += 1
+                self._queue.put(result)
+                return
+            if result.gesture_changed:
+                self._queue.put(result)
+                return
+        with self._lock:
+            self._dropped += 1
+
+    def _evict_oldest_droppable(self) -> bool:
+        q = self._queue
+        with q.mutex:
+            for item in q.queue:
+                if item is not _STOP and not item.gesture_changed:
+                    q.queue.remove(item)
+                    q.not_full.notify()
+                    return True
+        return False
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            t0 = time.perf_counter()
+            try:
+                self.sink.handle(item)
+            except Exception:
+                self._errors += 1
+                logging.exception("Sink %s failed", self.name)
+            dt = time.perf_counter() - t0
+            with self._lock:
+                self._processed += 1
+                self._busy_total += dt
+                self._busy_max = max(self._busy_max, dt)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            processed = self._processed
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_size": self._queue.maxsize,
+                "submitted": self._submitted,
+                "processed": processed,
+                "dropped": self._dropped,
+                "rate_limited": self._rate_limited,
+                "errors": self._errors,
+                "avg_ms": 1000.0 * self._busy_total / processed if processed else 0.0,
+                "max_ms": 1000.0 * self._busy_max,
+            }
+
+    def close(self, timeout: float = 2.0) -> None:
+        # Queued results (e.g. the last gesture change) are handled before stopping
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logging.warning(
+                "Sink %s did not drain its queue before shutdown", self.name
+            )
+        self._thread.join(timeout=timeout)
+        try:
+            self.sink.close()
+        except Exception:
+            logging.exception("Closing sink %s failed", self.name)
+
+
+class OutputBus:
+    """Fans each FrameResult out to registered sinks without blocking the loop."""
+
+    def __init__(self) -> None:
+        self._workers: Dict[str, SinkWorker] = {}
+
+    def register(
+        self,
+        name: str,
+        sink: Sink,
+        queue_size: int = 4,
+        drop_policy: str = "drop_oldest",
+        max_rate_hz: float = 0.0,
+    ) -> None:
+        if name in self._workers:
+            raise ValueError(f"Sink {name!r} is already registered")
+        self._workers[name] = SinkWorker(
+            sink, name, queue_size, drop_policy, max_rate_hz
+        )
+
+    def publish(self, result: FrameResult) -> None:
+        for worker in self._workers.values():
+            worker.submit(result)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: w.stats() for name, w in self._workers.items()}
+
+    def close(self) -> None:
+        for worker in self._workers.values():
+            worker.close()
+        self._workers.clear()
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+
+def save_frame(frame, frames_dir: str, gesture_name: str) -> None:
+    os.makedirs(frames_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    filename = f"{gesture_name}_{timestamp}.jpg"
+    cv2.imwrite(os.path.join(frames_dir, filename), frame)
+
+
+class DashboardSink(Sink):
+    name = "dashboard"
+
+    def __init__(
+        self,
+        state,
+        stats_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+        stats_interval_sec: float = 1.0,
+    ) -> None:
+        self.state = state
+        self.stats_fn = stats_fn
+        self.stats_interval_sec = float(stats_interval_sec)
+        self._last_stats = 0.0
+        self._last_hands = None
+
+    def handle(self, result: FrameResult) -> None:
+        # First hand only; None preserves the last landmarks on the dashboard.
+        # The MotionGate hands back the same list while the hand is still, so an
+        # identity check skips re-serializing it (and survives dropped events).
+        dash_landmarks = None
+        if result.hands and result.hands is not self._last_hands:
+            lm, _handed = result.hands[0]
+            dash_landmarks = [(x, y) for (x, y, _z) in lm]
+        self._last_hands = result.hands
+        self.state.update(
+            result.gesture_name, result.symbol, result.fps, dash_landmarks
+        )
+        # Published from this worker so the state keeps a single writer
+        if (
+            self.stats_fn
+            and result.timestamp - self._last_stats >= self.stats_interval_sec
+        ):
+            self.state.update_sinks(self.stats_fn())
+            self._last_stats = result.timestamp
+
+
+class OSCSink(Sink):
+    name = "osc"
+
+    def __init__(
+        self,
+        emitter,
+        fps_interval_sec: float = 0.5,
+        landmarks_keepalive_sec: float = 1.0,
+    ) -> None:
+        self.emitter = emitter
+        self.fps_interval_sec = float(fps_interval_sec)
+        self.landmarks_keepalive_sec = float(landmarks_keepalive_sec)
+        self._last_fps = 0.0
+        self._last_landmarks = 0.0
+        self._last_hands = None
+
+    def handle(self, result: FrameResult) -> None:
+        # Send FPS at a throttled interval
+        if result.timestamp - self._last_fps >= self.fps_interval_sec:
+            self.emitter.send_fps(result.fps)
+            self._last_fps = result.timestamp
+        # Optionally send landmarks; static holds only resend as a UDP keepalive
+        if self.emitter.landmarks_enabled and (
+            result.hands is not self._last_hands
+            or result.timestamp - self._last_landmarks >= self.landmarks_keepalive_sec
+        ):
+            self.emitter.send_landmarks(result.hands)
+            self._last_landmarks = result.timestamp
+            self._last_hands = result.hands
+        if result.gesture_changed and result.gesture_name is not None:
+            self.emitter.send_gesture(result.gesture_name, result.symbol)
+
+
+class LogSink(Sink):
+    name = "log"
+
+    def handle(self, result: FrameResult) -> None:
+        if result.gesture_changed and result.gesture_name is not None:
+            logging.info("GESTURE: %s | SYMBOL: %s", result.gesture_name, result.symbol)
+
+
+class FrameCaptureSink(Sink):
+    name = "frames"
+
+    def __init__(self, frames_dir: str) -> None:
+        self.frames_dir = frames_dir
+
+    def handle(self, result: FrameResult) -> None:
+        if (
+            result.gesture_changed
+            and result.gesture_name is not None
+            and result.frame is not None
+        ):
+            save_frame(result.frame, self.frames_dir, result.gesture_name)
+
+
+class StatsLogSink(Sink):
+    """Logs the bus's per-sink stats, so they are visible without the dashboard."""
+
+    name = "stats"
+
+    def __init__(
+        self, stats_fn: Callable[[], Dict[str, Any]], interval_sec: float = 10.0
+    ) -> None:
+        self.stats_fn = stats_fn
+        self.interval_sec = float(interval_sec)
+        self._last = None
+
+    def handle(self, result: FrameResult) -> None:
+        if self._last is None:
+            self._last = result.timestamp  # first report after one interval
+        elif result.timestamp - self._last >= self.interval_sec:
+            self._log()
+            self._last = result.timestamp
+
+    def close(self) -> None:
+        # Registered last, so the other workers have drained by now
+        if self._last is not None:
+            self._log()
+
+    def _log(self) -> None:
+        for name, s in self.stats_fn().items():
+            logging.info(
+                "SINK %s: queue %d/%d, processed %d, dropped %d, rate_limited %d, "
+                "errors %d, avg %.2f ms, max %.2f ms",
+                name,
+                s["queue_depth"],
+                s["queue_size"],
+                s["processed"],
+                s["dropped"],
+                s["rate_limited"],
+                s["errors"],
+                s["avg_ms"],
+                s["max_ms"],
+            )
+
+
+def load_factory(path: str) -> Callable[..., Sink]:
+    """Resolve "package.module:callable" to a sink factory."""
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Sink factory must look like 'module:callable', got {path!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_options(sink_cfg: dict) -> dict:
+    return {
+        "queue_size": int(sink_cfg.get("queue_size", 4)),
+        "drop_policy": str(sink_cfg.get("drop_policy", "drop_oldest")),
+        "max_rate_hz": float(sink_cfg.get("max_rate_hz", 0.0)),
+    }
+
+
+def build_output_bus(config: dict, dashboard_state=None, osc=None) -> OutputBus:
+    """Register the built-in sinks enabled in `config` plus any custom ones.
+
+    Custom sinks are listed under `sinks.custom` as
+    `{name, factory: "module:callable", queue_size, drop_policy, max_rate_hz}`;
+    the factory is called as `factory(config, sink_cfg)` and returns a Sink.
+    """
+    sinks_cfg = config.get("sinks", {}) or {}
+    bus = OutputBus()
+    try:
+        _register_sinks(bus, config, sinks_cfg, dashboard_state, osc)
+    except Exception:
+        bus.close()  # stop workers already started
+        raise
+    return bus
+
+
+def _register_sinks(
+    bus: OutputBus, config: dict, sinks_cfg: dict, dashboard_state, osc
+) -> None:
+    if dashboard_state is not None:
+        dash_cfg = sinks_cfg.get("dashboard", {}) or {}
+        bus.register(
+            "dashboard",
+            DashboardSink(
+                dashboard_state,
+                stats_fn=bus.stats,
+                stats_interval_sec=float(sinks_cfg.get("stats_interval_sec", 1.0)),
+            ),
+            **_worker_options(dash_cfg),
+        )
+    if osc is not None:
+        osc_cfg = config.get("osc", {})
+        bus.register(
+            "osc",
+            OSCSink(
+                osc,
+                fps_interval_sec=float(osc_cfg.get("fps_interval_sec", 0.5)),
+                landmarks_keepalive_sec=float(
+                    osc_cfg.get("landmarks_keepalive_sec", 1.0)
+                ),
+            ),
+            **_worker_options(sinks_cfg.get("osc", {}) or {}),
+        )
+    bus.register("log", LogSink(), **_worker_options(sinks_cfg.get("log", {}) or {}))
+    if config.get("capture_frames_on_change", False):
+        bus.register(
+            "frames",
+            FrameCaptureSink(str(config["frames_dir"])),
+            **_worker_options(sinks_cfg.get("frames", {}) or {}),
+        )
+
+    for sink_cfg in sinks_cfg.get("custom", []) or []:
+        if not sink_cfg.get("enabled", True):
+            continue
+        if not sink_cfg.get("factory"):
+            raise ValueError(f"Custom sink entry {sink_cfg!r} has no 'factory'")
+        factory = load_factory(str(sink_cfg["factory"]))
+        sink = factory(config, sink_cfg)
+        name = str(sink_cfg.get("name", getattr(sink, "name", "custom")))
+        bus.register(name, sink, **_worker_options(sink_cfg))
+
+    # Last, so its final report on close covers every other sink
+    stats_cfg = sinks_cfg.get("stats", {}) or {}
+    if stats_cfg.get("enabled", True):
+        bus.register(
+            "stats",
+            StatsLogSink(
+                bus.stats, interval_sec=float(stats_cfg.get("log_interval_sec", 10.0))
+            ),
+            **_worker_options({"queue_size": 1, **stats_cfg}),
+        )
@@ -0,0 +1,354 @@
+import glob
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class TimestampedFrame:
+    """A BGR frame with its capture time (time.time()) and sequence index."""
+
+    __slots__ = ("image", "timestamp", "index")
+
+    def __init__(self, image: np.ndarray, timestamp: float, index: int) -> None:
+        self.image = image
+        self.timestamp = timestamp
+        self.index = index
+
+
+class FrameSource:
+    """Base class for frame sources. `read()` returns None when exhausted or failed."""
+
+    def __init__(self, fps: float = 0.0) -> None:
+        self.fps = float(fps)
+        self._index = 0
+        self._next_due = 0.0
+
+    def open(self) -> bool:
+        return True
+
+    def read(self) -> Optional[TimestampedFrame]:
+        raise NotImplementedError
+
+    def release(self) -> None:
+        pass
+
+    def _pace(self) -> None:
+        # File and synthetic sources can emulate a live camera rate
+        if self.fps <= 0:
+            return
+        now = time.perf_counter()
+        if self._next_due > now:
+            time.sleep(self._next_due - now)
+        self._next_due = max(now, self._next_due) + 1.0 / self.fps
+
+    def _emit(self, image: np.ndarray) -> TimestampedFrame:
+        frame = TimestampedFrame(image, time.time(), self._index)
+        self._index += 1
+        return frame
+
+    def __enter__(self) -> "FrameSource":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class CameraSource(FrameSource):
+    """Webcam capture that always hands the loop the newest frame.
+
+    With `drop_stale`, a background thread keeps pulling frames (split
+    `grab()`/`retrieve()`, stamped at grab time) and keeps only the latest, so
+    frames that pile up while the loop is busy are skipped without ever making
+    `read()` wait for a frame newer than one already captured. Without it,
+    `read()` is a plain blocking grab/retrieve on the loop's thread.
+    """
+
+    def __init__(
+        self,
+        index: int = 0,
+        width: int = 1280,
+        height: int = 720,
+        buffer_size: int = 1,
+        fourcc: Optional[str] = None,
+        fps: float = 0.0,
+        drop_stale: bool = True,
+        read_timeout_sec: float = 2.0,
+    ) -> None:
+        super().__init__(fps=0.0)  # the camera paces itself
+        self.index = int(index)
+        self.width = int(width)
+        self.height = int(height)
+        self.buffer_size = int(buffer_size)
+        self.fourcc = fourcc
+        self.requested_fps = float(fps)
+        self.drop_stale = drop_stale
+        self.read_timeout_sec = float(read_timeout_sec)
+        self.stale_dropped = 0
+        self._cap = None
+        self._reader: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._cond = threading.Condition()
+        self._latest = None  # (image, timestamp) not yet returned by read()
+        self._ended = False
+
+    def open(self) -> bool:
+        # Prefer AVFoundation on macOS; fallback to default if needed
+        backend = cv2.CAP_AVFOUNDATION if hasattr(cv2, "CAP_AVFOUNDATION") else 0
+        cap = cv2.VideoCapture(self.index, backend)
+        if not cap.isOpened():
+            cap = cv2.VideoCapture(self.index)
+        if not cap.isOpened():
+            logging.error(
+                "Could not open webcam at index %s. On macOS, grant Camera access to Terminal/Python in System Settings > Privacy & Security > Camera.",
+                self.index,
+            )
+            return False
+        if self.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc[:4]))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.requested_fps > 0:
+            cap.set(cv2.CAP_PROP_FPS, self.requested_fps)
+        if self.buffer_size > 0:
+            # Not every backend honours this; the capture thread covers the rest
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        self._cap = cap
+        if self.drop_stale:
+            self._start_reader()
+        return True
+
+    def _start_reader(self) -> None:
+        self._stop.clear()
+        self._ended = False
+        self._reader = threading.Thread(
+            target=self._reader_loop, name="camera-capture", daemon=True
+        )
+        self._reader.start()
+
+    def _grab(self):
+        cap = self._cap  # release() may clear it while a grab is blocked
+        if cap is None or not cap.grab():
+            return None, 0.0
+        timestamp = time.time()
+        ok, image = cap.retrieve()
+        return (image if ok else None), timestamp
+
+    def _reader_loop(self) -> None:
+        while not self._stop.is_set():
+            image, timestamp = self._grab()
+            with self._cond:
+                if image is None:
+                    self._ended = True
+                    self._cond.notify_all()
+                    return
+                if self._latest is not None:
+                    self.stale_dropped += 1  # never reached the loop
+                self._latest = (image, timestamp)
+                self._cond.notify_all()
+
+    def read(self) -> Optional[TimestampedFrame]:
+        if self._cap is None:
+            return None
+        if self._reader is None:
+            image, timestamp = self._grab()
+        else:
+            with self._cond:
+                # A slow first frame or a brief stall is not the end of the stream:
+                # keep waiting until the capture thread reports a failed grab
+                while not self._cond.wait_for(
+                    lambda: self._latest is not None or self._ended,
+                    timeout=self.read_timeout_sec,
+                ):
+                    logging.warning(
+                        "No camera frame for %.1fs; still waiting",
+                        self.read_timeout_sec,
+                    )
+                if self._latest is None:
+                    return None
+                image, timestamp = self._latest
+                self._latest = None
+        if image is None:
+            return None
+        frame = TimestampedFrame(image, timestamp, self._index)
+        self._index += 1
+        return frame
+
+    def release(self) -> None:
+        if self._reader is not None:
+            self._stop.set()
+            with self._cond:
+                self._ended = True  # wake a read() still waiting
+                self._cond.notify_all()
+            self._reader.join(timeout=self.read_timeout_sec)
+            self._reader = None
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path: str, loop: bool = False, fps: float = 0.0) -> None:
+        super().__init__(fps=fps)
+        self.path = path
+        self.loop = loop
+        self._cap = None
+
+    def open(self) -> bool:
+        cap = cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            logging.error("Could not open video file %s", self.path)
+            return False
+        self._cap = cap
+        return True
+
+    def read(self) -> Optional[TimestampedFrame]:
+        if self._cap is None:
+            return None
+        ok, image = self._cap.read()
+        if not ok and self.loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, image = self._cap.read()
+        if not ok:
+            return None
+        self._pace()
+        return self._emit(image)
+
+    def release(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class ImageDirectorySource(FrameSource):
+    """Images from a directory in sorted filename order."""
+
+    def __init__(self, path: str, loop: bool = False, fps: float = 0.0) -> None:
+        super().__init__(fps=fps)
+        self.path = path
+        self.loop = loop
+        self._files: List[str] = []
+        self._pos = 0
+
+    def open(self) -> bool:
+        self._files = sorted(
+            f
+            for f in glob.glob(os.path.join(self.path, "*"))
+            if f.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self._files:
+            logging.error("No images found in %s", self.path)
+            return False
+        return True
+
+    def read(self) -> Optional[TimestampedFrame]:
+        # Bounded so a looping directory of unreadable files cannot spin forever
+        for _ in range(len(self._files)):
+            if self._pos >= len(self._files):
+                if not self.loop:
+                    return None
+                self._pos = 0
+            path = self._files[self._pos]
+            self._pos += 1
+            image = cv2.imread(path)
+            if image is None:
+                logging.warning("Skipping unreadable image %s", path)
+                continue
+            self._pace()
+            return self._emit(image)
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """Generated frames for headless runs: "moving_box", "gradient" or "noise"."""
+
+    PATTERNS = ("moving_box", "gradient", "noise")
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        pattern: str = "moving_box",
+        fps: float = 30.0,
+        num_frames: int = 0,
+    ) -> None:
+        super().__init__(fps=fps)
+        if pattern not in self.PATTERNS:
+            raise ValueError(
+                f"Unknown synthetic pattern {pattern!r}; "
+                f"expected one of {self.PATTERNS}"
+            )
+        self.width = int(width)
+        self.height = int(height)
+        self.pattern = pattern
+        self.num_frames = int(num_frames)  # 0 = endless
+        self._rng = np.random.default_rng(0)
+        self._gradient = np.tile(
+            np.linspace(0, 255, self.width, dtype=np.uint8)[None, :, None],
+            (self.height, 1, 3),
+        )
+
+    def read(self) -> Optional[TimestampedFrame]:
+        if self.num_frames and self._index >= self.num_frames:
+            return None
+        i = self._index
+        if self.pattern == "gradient":
+            image = np.roll(self._gradient, i * 4, axis=1)
+        elif self.pattern == "noise":
+            image = self._rng.integers(
+                0, 256, (self.height, self.width, 3), dtype=np.uint8
+            )
+        else:
+            image = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+            size = max(8, self.height // 6)
+            x = (i * 8) % max(1, self.width - size)
+            y = (self.height - size) // 2
+            image[y : y + size, x : x + size] = 255
+        self._pace()
+        return self._emit(image)
+
+
+SOURCE_TYPES = ("camera", "video", "images", "synthetic")
+
+
+def create_source(config: dict) -> FrameSource:
+    """Build the frame source selected by `source.type` in the config."""
+    src_cfg = config.get("source", {})
+    kind = str(src_cfg.get("type", "camera"))
+    fps = float(src_cfg.get("fps", 0.0))  # 0 = as fast as possible
+    loop = bool(src_cfg.get("loop", False))
+    if kind in ("video", "images") and not src_cfg.get("path"):
+        raise ValueError(f"source.path is required for source type {kind!r}")
+    if kind == "video":
+        return VideoFileSource(str(src_cfg["path"]), loop=loop, fps=fps)
+    if kind == "images":
+        return ImageDirectorySource(str(src_cfg["path"]), loop=loop, fps=fps)
+    if kind == "synthetic":
+        return SyntheticSource(
+            width=int(config["width"]),
+            height=int(config["height"]),
+            pattern=str(src_cfg.get("pattern", "moving_box")),
+            fps=float(src_cfg.get("fps", 30.0)),
+            num_frames=int(src_cfg.get("num_frames", 0)),
+        )
+    if kind != "camera":
+        raise ValueError(
+            f"Unknown source type {kind!r}; expected one of {SOURCE_TYPES}"
+        )
+    return CameraSource(
+        index=int(config["camera_index"]),
+        width=int(config["width"]),
+        height=int(config["height"]),
+        buffer_size=int(src_cfg.get("buffer_size", 1)),
+        fourcc=src_cfg.get("fourcc") or None,
+        fps=fps,
+        drop_stale=bool(src_cfg.get("drop_stale", True)),
+        read_timeout_sec=float(src_cfg.get("read_timeout_sec", 2.0)),
+    )
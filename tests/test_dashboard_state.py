@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from gesture_interface.dashboard_server import check_port_available
+from gesture_interface.dashboard_state import DashboardState, SharedDashboardState
+
+
+@pytest.fixture
+def shared_state():
+    state = SharedDashboardState.create()
+    yield state
+    state.close()
+
+
+def test_shared_state_round_trip(shared_state):
+    reader = SharedDashboardState.attach(shared_state.name)
+    try:
+        assert reader.get()["gesture"] is None
+        shared_state.update("FIST", "#STONE[SEAL]", 29.5, [(0.1, 0.2), (0.3, 0.4)])
+        got = reader.get()
+        assert got["gesture"] == "FIST"
+        assert got["symbol"] == "#STONE[SEAL]"
+        assert got["fps"] == 29.5
+        assert got["landmarks"] == [[0.1, 0.2], [0.3, 0.4]]
+    finally:
+        reader.close()
+
+
+def test_shared_state_keeps_landmarks_when_none(shared_state):
+    shared_state.update("POINT", "#ARROW[TRUE]", 30.0, [(0.5, 0.5)])
+    shared_state.update(None, None, 31.0)
+    got = shared_state.get()
+    assert got["gesture"] is None
+    assert got["landmarks"] == [[0.5, 0.5]]
+
+
+def test_shared_state_sinks(shared_state):
+    shared_state.update_sinks({"log": {"dropped": 3}})
+    assert shared_state.get()["sinks"] == {"log": {"dropped": 3}}
+
+
+def test_shared_state_rejects_oversized_payload():
+    state = SharedDashboardState.create(size=256)
+    try:
+        state.update("OPEN_PALM", "#FLAME[RISE]", 30.0, [(0.5, 0.5)] * 50)
+        # Too large to publish: readers keep the last snapshot that fit
+        assert state.get()["gesture"] is None
+    finally:
+        state.close()
+
+
+def _write_many(name, count):
+    state = SharedDashboardState.attach(name)
+    try:
+        for i in range(count):
+            state.update(f"G{i}", str(i), float(i), [(i / count, i / count)] * 21)
+    finally:
+        state.close()
+
+
+def test_shared_state_concurrent_reads_are_consistent(shared_state):
+    ctx = multiprocessing.get_context("spawn")
+    count = 2000
+    writer = ctx.Process(target=_write_many, args=(shared_state.name, count))
+    writer.start()
+    while writer.is_alive():
+        got = shared_state.get()
+        if got["gesture"] is not None:
+            i = int(got["symbol"])
+            # Every field comes from the same update, never a torn mix
+            assert got["gesture"] == f"G{i}"
+            assert got["fps"] == float(i)
+            assert got["landmarks"][0] == [i / count, i / count]
+    writer.join()
+    assert writer.exitcode == 0
+    assert shared_state.get()["gesture"] == f"G{count - 1}"
+
+
+def test_dashboard_state_update_sinks():
+    state = DashboardState()
+    state.update_sinks({"osc": {"dropped": 1}})
+    assert state.get()["sinks"] == {"osc": {"dropped": 1}}
+
+
+def test_check_port_available_detects_listener():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        port = s.getsockname()[1]
+        with pytest.raises(OSError):
+            check_port_available("127.0.0.1", port)
+    check_port_available("127.0.0.1", port)
+
+
+def test_dashboard_process_imports_stay_light():
+    # What the spawned dashboard child imports: no cv2/MediaPipe via .main
+    code = (
+        "import sys, gesture_interface.dashboard_server; "
+        "print(sorted(m for m in ('cv2', 'mediapipe', 'gesture_interface.main') "
+        "if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+    )
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,118 @@
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gesture_interface import detector as detector_mod
+from gesture_interface.detector import LiveStreamHandLandmarkDetector, create_detector
+
+
+class StubLandmarker:
+    def __init__(self) -> None:
+        self.submitted = []
+        self.closed = False
+
+    def detect_async(self, image, timestamp_ms) -> None:
+        self.submitted.append(timestamp_ms)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mp(monkeypatch):
+    """Just enough of the MediaPipe Tasks API for the live-stream wrapper."""
+    landmarker = StubLandmarker()
+    vision = SimpleNamespace(
+        HandLandmarkerOptions=lambda **kw: kw,
+        RunningMode=SimpleNamespace(LIVE_STREAM="live_stream"),
+        HandLandmarker=SimpleNamespace(create_from_options=lambda opts: landmarker),
+    )
+    fake = SimpleNamespace(
+        tasks=SimpleNamespace(vision=vision, BaseOptions=lambda **kw: kw),
+        Image=lambda **kw: kw,
+        ImageFormat=SimpleNamespace(SRGB="srgb"),
+    )
+    monkeypatch.setattr(detector_mod, "mp", fake)
+    return landmarker
+
+
+@pytest.fixture
+def live(fake_mp, tmp_path):
+    model = tmp_path / "hand_landmarker.task"
+    model.write_bytes(b"")
+    return LiveStreamHandLandmarkDetector(str(model))
+
+
+FRAME = np.zeros((4, 4, 3), dtype=np.uint8)
+
+
+def _result(*xs):
+    """A HandLandmarkerResult-like object with one hand per x."""
+    return SimpleNamespace(
+        hand_landmarks=[[SimpleNamespace(x=x, y=0.5, z=0.0)] * 21 for x in xs],
+        handedness=[[SimpleNamespace(category_name="Right")] for _ in xs],
+    )
+
+
+def test_timestamps_strictly_increase(live, fake_mp):
+    for captured in (10.0, 10.0, 9.5, 10.0005, 11.0):
+        live.process(FRAME, captured)
+    assert fake_mp.submitted == [10000, 10001, 10002, 10003, 11000]
+    assert live.submitted == 5
+
+
+def test_callback_counts_skipped_frames_and_latency(live, fake_mp, monkeypatch):
+    for captured in (10.0, 10.1, 10.2):
+        live.process(FRAME, captured)
+    monkeypatch.setattr(detector_mod.time, "time", lambda: 10.25)
+    # MediaPipe skipped the first two submissions and answered the third
+    live._on_result(_result(0.3), None, 10200)
+    assert live.dropped == 2
+    assert live.completed == 1
+    assert live.last_latency_ms == pytest.approx(50.0)
+
+
+def test_process_returns_latest_callback_result(live):
+    assert live.process(FRAME, 1.0) == []
+    live._on_result(_result(0.3), None, 1000)
+    hands = live.process(FRAME, 1.1)
+    assert len(hands) == 1
+    lm, handedness = hands[0]
+    assert handedness == "Right"
+    assert lm[0] == (0.3, 0.5, 0.0) and len(lm) == 21
+    live._on_result(_result(), None, 1100)
+    assert live.process(FRAME, 1.2) == []
+
+
+def _config(**detector):
+    return {
+        "max_num_hands": 1,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.5,
+        "detector": detector,
+    }
+
+
+def test_create_detector_missing_model(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        create_detector(
+            _config(
+                backend="tasks_live_stream",
+                model_path=str(tmp_path / "missing.task"),
+            )
+        )
+
+
+def test_create_detector_unknown_backend_falls_back(monkeypatch, caplog):
+    class StubSolutions:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(detector_mod, "HandLandmarkDetector", StubSolutions)
+    with caplog.at_level(logging.WARNING):
+        det = create_detector(_config(backend="gpu_magic"))
+    assert isinstance(det, StubSolutions)
+    assert det.kwargs["max_num_hands"] == 1
+    assert "Unknown detector backend" in caplog.text
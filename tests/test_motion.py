@@ -0,0 +1,68 @@
+from gesture_interface.motion import MotionGate
+
+
+def _hand(dx=0.0, label="Right", n=21):
+    return ([(0.5 + dx, 0.5, 0.0)] * n, label)
+
+
+def test_first_frame_always_changes():
+    gate = MotionGate(epsilon=0.01)
+    hands = [_hand()]
+    assert gate.update(hands) == (hands, True)
+
+
+def test_small_move_returns_cached_object():
+    gate = MotionGate(epsilon=0.01)
+    first = [_hand()]
+    gate.update(first)
+    hands, changed = gate.update([_hand(dx=0.005)])
+    assert not changed
+    assert hands is first
+
+
+def test_large_move_changes():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([_hand()])
+    moved = [_hand(dx=0.02)]
+    assert gate.update(moved) == (moved, True)
+
+
+def test_z_is_ignored():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([([(0.5, 0.5, 0.0)] * 21, "Right")])
+    assert not gate.update([([(0.5, 0.5, 0.9)] * 21, "Right")])[1]
+
+
+def test_drift_is_measured_from_last_accepted_frame():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([_hand()])
+    # Each step is below epsilon, but the total drift is not
+    assert not gate.update([_hand(dx=0.006)])[1]
+    assert gate.update([_hand(dx=0.012)])[1]
+
+
+def test_hand_count_change():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([_hand()])
+    assert gate.update([])[1]
+    assert not gate.update([])[1]
+    assert gate.update([_hand(), _hand(label="Left")])[1]
+
+
+def test_handedness_change():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([_hand(label="Right")])
+    assert gate.update([_hand(label="Left")])[1]
+
+
+def test_landmark_count_change():
+    gate = MotionGate(epsilon=0.01)
+    gate.update([_hand(n=21)])
+    assert gate.update([_hand(n=20)])[1]
+
+
+def test_disabled_gate_always_changes():
+    gate = MotionGate(epsilon=0.01, enabled=False)
+    gate.update([_hand()])
+    same = [_hand()]
+    assert gate.update(same) == (same, True)
@@ -0,0 +1,40 @@
+import numpy as np
+
+from gesture_interface.renderer import OverlayRenderer
+
+
+def _hand(x=0.5):
+    return ([(x + 0.01 * i, 0.5, 0.0) for i in range(21)], "Right")
+
+
+def _frame(h=120, w=160):
+    return np.zeros((h, w, 3), dtype=np.uint8)
+
+
+def test_unchanged_hands_reuse_cached_layer():
+    renderer = OverlayRenderer(draw_fps=False)
+    renderer.render(_frame(), [_hand()], None, None, 30.0, hands_changed=True)
+    layer = renderer._hand_layer
+    assert layer.any()
+    # Different hands, but the gate said nothing moved: the layer is not redrawn
+    renderer.render(_frame(), [_hand(x=0.1)], None, None, 30.0, hands_changed=False)
+    assert renderer._hand_layer is layer
+
+
+def test_changed_hands_redraw_layer():
+    renderer = OverlayRenderer(draw_fps=False)
+    renderer.render(_frame(), [_hand()], None, None, 30.0, hands_changed=True)
+    layer = renderer._hand_layer
+    renderer.render(_frame(), [_hand(x=0.1)], None, None, 30.0, hands_changed=True)
+    assert renderer._hand_layer is not layer
+    assert not np.array_equal(renderer._hand_layer, layer)
+
+
+def test_frame_shape_change_redraws_cached_layer():
+    renderer = OverlayRenderer(draw_fps=False)
+    renderer.render(_frame(), [_hand()], None, None, 30.0, hands_changed=True)
+    out = renderer.render(
+        _frame(90, 200), [_hand()], None, None, 30.0, hands_changed=False
+    )
+    assert renderer._hand_layer.shape == (90, 200, 3)
+    assert out.shape == (90, 200, 3)
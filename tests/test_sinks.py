@@ -0,0 +1,255 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from gesture_interface.sinks import (
+    DashboardSink,
+    FrameResult,
+    OSCSink,
+    OutputBus,
+    Sink,
+    SinkWorker,
+    StatsLogSink,
+    build_output_bus,
+)
+
+
+class RecordingSink(Sink):
+    """Records frame indices; blocks in handle() until `gate` is set."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.seen = []
+
+    def handle(self, result: FrameResult) -> None:
+        self.started.set()
+        self.gate.wait(5.0)
+        self.seen.append(result.frame_index)
+
+
+def _result(i, changed=False):
+    return FrameResult(time.time(), i, [], None, None, 30.0, gesture_changed=changed)
+
+
+def _stalled_worker(sink, **kwargs):
+    """A worker whose thread is parked inside handle() on frame 0."""
+    worker = SinkWorker(sink, "test", **kwargs)
+    worker.submit(_result(0))
+    assert sink.started.wait(5.0)
+    return worker
+
+
+def test_drop_oldest_keeps_newest():
+    sink = RecordingSink()
+    worker = _stalled_worker(sink, queue_size=2, drop_policy="drop_oldest")
+    for i in range(1, 6):
+        worker.submit(_result(i))
+    sink.gate.set()
+    worker.close()
+    assert sink.seen == [0, 4, 5]
+    assert worker.stats()["dropped"] == 3
+
+
+def test_drop_newest_keeps_oldest():
+    sink = RecordingSink()
+    worker = _stalled_worker(sink, queue_size=2, drop_policy="drop_newest")
+    for i in range(1, 6):
+        worker.submit(_result(i))
+    sink.gate.set()
+    worker.close()
+    assert sink.seen == [0, 1, 2]
+    assert worker.stats()["dropped"] == 3
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest"])
+def test_gesture_changes_are_never_dropped(policy):
+    sink = RecordingSink()
+    worker = _stalled_worker(sink, queue_size=2, drop_policy=policy)
+    worker.submit(_result(1, changed=True))
+    worker.submit(_result(2))
+    worker.submit(_result(3, changed=True))  # evicts 2, not 1
+    worker.submit(_result(4))  # queue holds only changes: dropped
+    sink.gate.set()
+    worker.close()
+    assert sink.seen == [0, 1, 3]
+
+
+def test_gesture_change_waits_when_queue_is_all_changes():
+    sink = RecordingSink()
+    worker = _stalled_worker(sink, queue_size=1, drop_policy="drop_oldest")
+    worker.submit(_result(1, changed=True))
+    threading.Timer(0.2, sink.gate.set).start()
+    worker.submit(_result(2, changed=True))  # blocks until the worker frees a slot
+    worker.close()
+    assert sink.seen == [0, 1, 2]
+
+
+def test_close_drains_queue():
+    sink = RecordingSink()
+    worker = _stalled_worker(sink, queue_size=4, drop_policy="drop_newest")
+    for i in range(1, 5):
+        worker.submit(_result(i))
+    threading.Timer(0.1, sink.gate.set).start()
+    worker.close()
+    assert sink.seen == [0, 1, 2, 3, 4]
+
+
+def test_rate_limit_skips_ordinary_results_but_not_changes():
+    sink = RecordingSink()
+    sink.gate.set()
+    worker = SinkWorker(sink, "test", queue_size=16, max_rate_hz=1.0)
+    worker.submit(_result(0))
+    worker.submit(_result(1))
+    worker.submit(_result(2, changed=True))
+    worker.close()
+    assert sink.seen == [0, 2]
+    assert worker.stats()["rate_limited"] == 1
+
+
+def test_failing_sink_counts_errors_and_keeps_running():
+    class Failing(Sink):
+        def __init__(self):
+            self.calls = 0
+
+        def handle(self, result):
+            self.calls += 1
+            raise RuntimeError("boom")
+
+    sink = Failing()
+    worker = SinkWorker(sink, "failing", queue_size=4)
+    worker.submit(_result(0))
+    worker.submit(_result(1))
+    worker.close()
+    assert sink.calls == 2
+    assert worker.stats()["errors"] == 2
+
+
+def test_unknown_drop_policy_rejected():
+    with pytest.raises(ValueError):
+        SinkWorker(RecordingSink(), "bad", drop_policy="sometimes")
+
+
+def test_bus_rejects_duplicate_names():
+    bus = OutputBus()
+    bus.register("a", RecordingSink())
+    with pytest.raises(ValueError):
+        bus.register("a", RecordingSink())
+    bus.close()
+
+
+def make_recording_sink(config, sink_cfg):
+    return RecordingSink()
+
+
+def _config(**sinks):
+    return {"capture_frames_on_change": False, "frames_dir": "frames", "sinks": sinks}
+
+
+def test_build_output_bus_loads_custom_factory():
+    bus = build_output_bus(
+        _config(custom=[{"name": "rec", "factory": f"{__name__}:make_recording_sink"}])
+    )
+    try:
+        assert set(bus.stats()) == {"log", "rec", "stats"}
+    finally:
+        bus.close()
+
+
+@pytest.mark.parametrize(
+    "sinks, error",
+    [
+        ({"log": {"drop_policy": "sometimes"}}, ValueError),
+        ({"custom": [{"name": "x"}]}, ValueError),
+        ({"custom": [{"factory": "no_such_module_xyz:make"}]}, ImportError),
+    ],
+)
+def test_build_output_bus_config_errors(sinks, error):
+    with pytest.raises(error):
+        build_output_bus(_config(**sinks))
+
+
+def test_stats_log_sink_reports_every_interval_and_on_close(caplog):
+    keys = ("queue_depth", "queue_size", "processed", "dropped", "rate_limited")
+    stats = {"log": dict.fromkeys(keys + ("errors", "avg_ms", "max_ms"), 0)}
+    sink = StatsLogSink(lambda: stats, interval_sec=1.0)
+    with caplog.at_level(logging.INFO):
+        for t in (100.0, 100.5, 101.0, 101.5):
+            sink.handle(FrameResult(t, 0, [], None, None, 30.0))
+        assert sum("SINK log:" in r.message for r in caplog.records) == 1
+        sink.close()
+    assert sum("SINK log:" in r.message for r in caplog.records) == 2
+
+
+def test_stats_are_logged_without_dashboard(caplog):
+    bus = build_output_bus(_config(stats={"log_interval_sec": 0.0}))
+    with caplog.at_level(logging.INFO):
+        for i in range(3):
+            bus.publish(_result(i))
+        bus.close()
+    assert any(r.message.startswith("SINK log:") for r in caplog.records)
+
+
+def test_stats_sink_can_be_disabled():
+    bus = build_output_bus(_config(stats={"enabled": False}))
+    try:
+        assert set(bus.stats()) == {"log"}
+    finally:
+        bus.close()
+
+
+def _hands(x=0.5):
+    return [([(x, 0.5, 0.0)] * 21, "Right")]
+
+
+class FakeDashboardState:
+    def __init__(self) -> None:
+        self.landmarks = []
+
+    def update(self, gesture, symbol, fps, landmarks=None) -> None:
+        self.landmarks.append(landmarks)
+
+    def update_sinks(self, sinks) -> None:
+        pass
+
+
+def test_dashboard_sink_skips_landmarks_for_same_hands_object():
+    state = FakeDashboardState()
+    sink = DashboardSink(state)
+    held, moved = _hands(), _hands(0.6)
+    for t, hands in enumerate([held, held, moved, moved]):
+        sink.handle(FrameResult(float(t), t, hands, None, None, 30.0))
+    assert state.landmarks[0] == [(0.5, 0.5)] * 21
+    assert state.landmarks[1] is None
+    assert state.landmarks[2] == [(0.6, 0.5)] * 21
+    assert state.landmarks[3] is None
+
+
+class FakeEmitter:
+    landmarks_enabled = True
+
+    def __init__(self) -> None:
+        self.landmarks = []
+
+    def send_fps(self, fps) -> None:
+        pass
+
+    def send_landmarks(self, hands) -> None:
+        self.landmarks.append(hands)
+
+    def send_gesture(self, name, symbol) -> None:
+        pass
+
+
+def test_osc_sink_resends_landmarks_on_change_or_keepalive():
+    emitter = FakeEmitter()
+    sink = OSCSink(emitter, landmarks_keepalive_sec=1.0)
+    held, moved = _hands(), _hands(0.6)
+    frames = [(0.0, held), (0.4, held), (0.8, held), (1.2, moved), (1.5, moved)]
+    frames += [(2.0, moved), (2.3, moved)]
+    for t, hands in frames:
+        sink.handle(FrameResult(t, 0, hands, None, None, 30.0))
+    # First frame, the change at 1.2s, then a keepalive at 2.3s
+    assert emitter.landmarks == [held, moved, moved]
@@ -0,0 +1,240 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from gesture_interface.dashboard_state import DashboardState
+from gesture_interface.motion import MotionGate
+from gesture_interface.renderer import OverlayRenderer
+from gesture_interface.sinks import FrameResult, build_output_bus
+from gesture_interface.sources import (
+    CameraSource,
+    ImageDirectorySource,
+    SyntheticSource,
+    VideoFileSource,
+    create_source,
+)
+
+
+def _drain(source, limit=100):
+    frames = []
+    while len(frames) < limit:
+        frame = source.read()
+        if frame is None:
+            break
+        frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize("pattern", SyntheticSource.PATTERNS)
+def test_synthetic_source_patterns(pattern):
+    source = SyntheticSource(width=64, height=48, pattern=pattern, fps=0, num_frames=3)
+    frames = _drain(source)
+    assert [f.index for f in frames] == [0, 1, 2]
+    assert all(f.image.shape == (48, 64, 3) for f in frames)
+    assert frames[0].timestamp <= frames[1].timestamp <= frames[2].timestamp
+
+
+def test_synthetic_source_paces_to_fps():
+    source = SyntheticSource(width=16, height=16, fps=50, num_frames=6)
+    start = time.perf_counter()
+    _drain(source)
+    assert time.perf_counter() - start >= 0.09  # 5 intervals of 20 ms
+
+
+def test_synthetic_source_rejects_unknown_pattern():
+    with pytest.raises(ValueError):
+        SyntheticSource(pattern="plaid")
+
+
+def _write_images(directory, count):
+    for i in range(count):
+        cv2.imwrite(str(directory / f"{i:03d}.png"), np.full((8, 8, 3), i, np.uint8))
+
+
+def test_image_directory_source_order_and_skips(tmp_path):
+    _write_images(tmp_path, 3)
+    (tmp_path / "001b.jpg").write_bytes(b"not an image")
+    (tmp_path / "notes.txt").write_text("ignored")
+    source = ImageDirectorySource(str(tmp_path))
+    assert source.open()
+    frames = _drain(source)
+    assert [int(f.image[0, 0, 0]) for f in frames] == [0, 1, 2]
+    assert [f.index for f in frames] == [0, 1, 2]
+
+
+def test_image_directory_source_loops(tmp_path):
+    _write_images(tmp_path, 2)
+    source = ImageDirectorySource(str(tmp_path), loop=True)
+    assert source.open()
+    frames = _drain(source, limit=5)
+    assert [int(f.image[0, 0, 0]) for f in frames] == [0, 1, 0, 1, 0]
+
+
+def test_image_directory_source_empty(tmp_path):
+    assert not ImageDirectorySource(str(tmp_path)).open()
+
+
+def _write_video(path, count):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (32, 24))
+    for i in range(count):
+        writer.write(np.full((24, 32, 3), i * 40, np.uint8))
+    writer.release()
+
+
+def test_video_file_source(tmp_path):
+    path = tmp_path / "clip.avi"
+    _write_video(path, 4)
+    with VideoFileSource(str(path)) as source:
+        frames = _drain(source)
+    assert len(frames) == 4
+    assert frames[0].image.shape == (24, 32, 3)
+
+
+def test_video_file_source_loops(tmp_path):
+    path = tmp_path / "clip.avi"
+    _write_video(path, 2)
+    with VideoFileSource(str(path), loop=True) as source:
+        assert len(_drain(source, limit=5)) == 5
+
+
+def test_video_file_source_missing(tmp_path):
+    assert not VideoFileSource(str(tmp_path / "missing.avi")).open()
+
+
+def test_create_source_types(tmp_path):
+    base = {"camera_index": 0, "width": 32, "height": 24}
+    synthetic = create_source({**base, "source": {"type": "synthetic"}})
+    assert isinstance(synthetic, SyntheticSource)
+    images = create_source({**base, "source": {"type": "images", "path": str(tmp_path)}})
+    assert isinstance(images, ImageDirectorySource)
+    with pytest.raises(ValueError):
+        create_source({**base, "source": {"type": "video"}})
+    with pytest.raises(ValueError):
+        create_source({**base, "source": {"type": "hologram"}})
+
+
+class FakeCapture:
+    """Produces a new frame every `period` seconds, like a live camera."""
+
+    def __init__(self, period, limit=None):
+        self.period = period
+        self.limit = limit
+        self.count = 0
+        self._next = time.perf_counter() + period
+
+    def grab(self):
+        if self.limit is not None and self.count >= self.limit:
+            return False
+        delay = self._next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self._next += self.period
+        self.count += 1
+        return True
+
+    def retrieve(self):
+        return True, np.full((4, 4, 3), self.count % 256, np.uint8)
+
+    def release(self):
+        pass
+
+
+def _fake_camera(period, limit=None):
+    source = CameraSource(drop_stale=True)
+    source._cap = FakeCapture(period, limit)
+    source._start_reader()
+    return source
+
+
+def test_camera_source_slow_loop_gets_newest_frames():
+    # 100 fps camera, 50 ms loop: frames captured in between are skipped, and
+    # every read returns a frame newer than the last one
+    source = _fake_camera(period=0.01)
+    try:
+        grabbed = []
+        for _ in range(6):
+            time.sleep(0.05)
+            grabbed.append(int(source.read().image[0, 0, 0]))
+    finally:
+        source.release()
+    assert grabbed == sorted(set(grabbed))
+    assert source.stale_dropped > 0
+
+
+class StallingCapture(FakeCapture):
+    """Delivers nothing for `stall` seconds, then behaves like FakeCapture."""
+
+    def __init__(self, period, stall):
+        super().__init__(period)
+        self._next = time.perf_counter() + stall
+
+
+def test_camera_source_waits_through_stall():
+    source = CameraSource(drop_stale=True, read_timeout_sec=0.05)
+    source._cap = StallingCapture(period=0.01, stall=0.2)
+    source._start_reader()
+    try:
+        frame = source.read()
+    finally:
+        source.release()
+    assert frame is not None
+
+
+def test_camera_source_release_wakes_waiting_read():
+    source = CameraSource(drop_stale=True, read_timeout_sec=0.05)
+    source._cap = FakeCapture(period=60.0)  # no frame during the test
+    source._start_reader()
+    frames = []
+    reader = threading.Thread(target=lambda: frames.append(source.read()))
+    reader.start()
+    time.sleep(0.1)
+    source.release()
+    reader.join(5.0)
+    assert not reader.is_alive()
+    assert frames == [None]
+
+
+def test_camera_source_waits_for_next_frame_when_caught_up():
+    source = _fake_camera(period=0.03)
+    try:
+        first = source.read()
+        second = source.read()
+    finally:
+        source.release()
+    assert second.index == first.index + 1
+    assert second.timestamp > first.timestamp
+
+
+def test_camera_source_end_of_stream():
+    source = _fake_camera(period=0.001, limit=2)
+    try:
+        frames = _drain(source)
+    finally:
+        source.release()
+    assert 1 <= len(frames) <= 2
+
+
+def test_headless_pipeline_on_synthetic_frames():
+    """Source -> gate -> render -> sinks without a camera, detector or window."""
+    config = {
+        "capture_frames_on_change": False,
+        "frames_dir": "frames",
+        "sinks": {"dashboard": {"queue_size": 1}},
+    }
+    state = DashboardState()
+    bus = build_output_bus(config, dashboard_state=state)
+    source = SyntheticSource(width=64, height=48, fps=0, num_frames=5)
+    gate, renderer = MotionGate(), OverlayRenderer()
+    last = None
+    for frame in _drain(source):
+        hands, changed = gate.update([])
+        out = renderer.render(frame.image, hands, None, None, 30.0, changed)
+        assert out.shape == frame.image.shape
+        last = FrameResult(frame.timestamp, frame.index, hands, None, None, 30.0)
+        bus.publish(last)
+    bus.close()
+    assert last is not None and last.frame_index == 4
+    assert state.get()["fps"] == 30.0